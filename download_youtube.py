@@ -0,0 +1,78 @@
+import os
+import argparse
+from functools import partial
+from multiprocessing import Pool
+import yt_dlp
+
+def download_audio(url, output_dir, concurrent_fragments=5, show_progress=True):
+    # yt-dlp options:
+    # - 'format': selects the best available audio format
+    # - 'outtmpl': output file template (you can include directory and filename)
+    # - 'concurrent_fragment_downloads': fetches DASH/HLS fragments in parallel
+    # - 'noprogress': hides the progress bar (parallel bars would interleave)
+    # - 'postprocessors': extracts audio and converts to MP3 (requires ffmpeg installed)
+    filename = '%(title)s.%(ext)s'
+    ydl_opts = {
+        'format': 'bestaudio/best',
+        'outtmpl': os.path.join(output_dir, filename),
+        'concurrent_fragment_downloads': concurrent_fragments,
+        'noprogress': not show_progress,
+        'postprocessors': [{
+            'key': 'FFmpegExtractAudio',
+            'preferredcodec': 'mp3',
+            'preferredquality': '192',
+        }]
+    }
+    
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        info = ydl.extract_info(url, download=True)
+
+    # Final paths after post-processing (the .mp3 files), as reported by yt-dlp;
+    # playlists report them per entry
+    entries = info.get('entries') or [info]
+    return [download['filepath'] for entry in entries if entry
+            for download in entry.get('requested_downloads', [])]
+
+def download_or_report(url, **kwargs):
+    # Runs in the worker pool: a failing URL must not discard the other results,
+    # so return None instead of raising (yt-dlp has already printed the error)
+    try:
+        return download_audio(url, **kwargs)
+    except yt_dlp.utils.DownloadError:
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description='Download Youtube Audio')
+    parser.add_argument('urls', type=str, nargs='+', help='YouTube URLs')
+    parser.add_argument('--output', '-o', type=str, default=".", help='Output directory for audio')
+    parser.add_argument('--concurrent-fragments', '-N', type=int, default=5,
+                        help='Number of fragments to download in parallel')
+    parser.add_argument('--n-dl-workers', '-w', type=int, default=4,
+                        help='Number of URLs to download in parallel')
+
+    args = parser.parse_args()
+
+    workers = max(1, min(args.n_dl_workers, len(args.urls)))
+    download = partial(download_or_report, output_dir=args.output,
+                       concurrent_fragments=args.concurrent_fragments,
+                       show_progress=workers == 1)
+    if workers == 1:
+        results = [download(url) for url in args.urls]
+    else:
+        # Each worker runs its own yt-dlp instance, one URL at a time
+        with Pool(workers) as pool:
+            results = pool.map(download, args.urls)
+
+    failed = 0
+    for url, filepaths in zip(args.urls, results):
+        if filepaths is None:
+            failed += 1
+            print(f"Failed to download {url}")
+            continue
+        for filepath in filepaths:
+            print(f"Audio saved to {filepath}")
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    exit(main())
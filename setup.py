@@ -3,15 +3,21 @@ from setuptools import setup
 setup(
     name="video-transcriber",
     version="0.1.0",
-    py_modules=["video_transcriber"],
+    py_modules=["video_transcriber", "download_youtube"],
     install_requires=[
         "openai-whisper",
+        "av",
+        "numpy",
         "tqdm",
         "yt_dlp",
     ],
+    extras_require={
+        "faster-whisper": ["faster-whisper"],
+    },
     entry_points={
         "console_scripts": [
             "video-transcriber=video_transcriber:main",
+            "video-downloader=download_youtube:main",
         ],
     },
 )
\ No newline at end of file
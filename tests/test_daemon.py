@@ -0,0 +1,111 @@
+"""Concurrent requests against a multi-worker transcription daemon."""
+import importlib.util
+import os
+import signal
+import socket
+import subprocess
+import sys
+import textwrap
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Client
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+whisper_model = pytest.importorskip("whisper.model")
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "video-transcriber.py")
+AUTHKEY = "test-daemon-key"
+WORKERS = 3
+
+
+def load_transcriber_module():
+    spec = importlib.util.spec_from_file_location("video_transcriber", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+def write_checkpoint(path: str):
+    """A tiny randomly initialised Whisper checkpoint, loadable with whisper.load_model(path)."""
+    dims = whisper_model.ModelDimensions(
+        n_mels=80, n_audio_ctx=1500, n_audio_state=64, n_audio_head=2, n_audio_layer=1,
+        n_vocab=51865, n_text_ctx=16, n_text_state=64, n_text_head=2, n_text_layer=1,
+    )
+    torch.manual_seed(0)
+    model = whisper_model.Whisper(dims)
+    with torch.no_grad():
+        for parameter in model.parameters():
+            parameter.normal_(0, 0.02)
+    torch.save({"dims": dims.__dict__, "model_state_dict": model.state_dict()}, path)
+
+
+def write_wav(path: str, seconds: float = 2.0):
+    samples = (np.random.default_rng(0).uniform(-0.1, 0.1, int(16000 * seconds)) * 32767).astype(np.int16)
+    with wave.open(path, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(16000)
+        f.writeframes(samples.tobytes())
+
+
+def wait_for_daemon(port: int, process: subprocess.Popen, timeout: float = 120):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        assert process.poll() is None, "daemon exited during startup"
+        try:
+            Client(("localhost", port), authkey=AUTHKEY.encode()).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    pytest.fail("daemon did not start listening")
+
+
+def test_concurrent_requests_to_multi_worker_daemon(tmp_path, monkeypatch):
+    checkpoint = str(tmp_path / "tiny.pt")
+    write_checkpoint(checkpoint)
+    inputs = []
+    for i in range(WORKERS):
+        write_wav(str(tmp_path / f"talk{i}.wav"))
+        inputs.append(str(tmp_path / f"talk{i}.wav"))
+
+    # More threads than one, so the parent would start torch's OpenMP pool if it computed before forking
+    monkeypatch.setenv("WHISPER_THREADS", "4")
+    monkeypatch.setenv("VIDEO_TRANSCRIBER_AUTHKEY", AUTHKEY)
+    port = free_port()
+    server = textwrap.dedent(f"""
+        import importlib.util
+        spec = importlib.util.spec_from_file_location("video_transcriber", {SCRIPT!r})
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        module.serve(module.VideoTranscriber({checkpoint!r}, device="cpu"), port={port}, workers={WORKERS})
+    """)
+    daemon = subprocess.Popen([sys.executable, "-c", server], start_new_session=True)
+    executor = ThreadPoolExecutor(WORKERS)
+    try:
+        wait_for_daemon(port, daemon)
+        transcriber = load_transcriber_module()
+        futures = [
+            executor.submit(transcriber.send_to_daemon, path, None, "en", False, port)
+            for path in inputs
+        ]
+        # A deadlocked worker never answers; fail instead of hanging the test run
+        results = [future.result(timeout=300) for future in futures]
+    finally:
+        # Killing the daemon and its workers also unblocks any client still waiting
+        os.killpg(daemon.pid, signal.SIGKILL)
+        daemon.wait()
+        executor.shutdown()
+
+    for path, result in zip(inputs, results):
+        assert result == [os.path.splitext(path)[0] + ".txt"]
+        assert os.path.exists(os.path.splitext(path)[0] + ".srt")
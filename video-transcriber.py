@@ -1,108 +1,411 @@
 #!/usr/bin/env python3
 import os
 import argparse
-import subprocess
+import dataclasses
+import multiprocessing
+import secrets
 import tempfile
 import time
-from typing import List, Optional
+import wave
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from multiprocessing.connection import AuthenticationError, Client, Listener
+from typing import Iterator, List, Optional, Tuple
+import av
+import numpy as np
+import torch
+import torch.nn.functional as F
 import whisper
 from tqdm import tqdm
 
+# Default local port of the transcription daemon (--daemon/--client)
+DAEMON_PORT = 6000
+
+
+def _sdpa_qkv_attention(self, q, k, v, mask=None):
+    """Replacement for MultiHeadAttention.qkv_attention in openai-whisper releases without SDPA support."""
+    n_ctx = q.shape[1]
+    q, k, v = (t.view(*t.shape[:2], self.n_head, -1).permute(0, 2, 1, 3) for t in (q, k, v))
+    out = F.scaled_dot_product_attention(q, k, v, is_causal=mask is not None and n_ctx > 1)
+    # The attention weights are only needed for word-level timestamps, which are not used here
+    return out.permute(0, 2, 1, 3).flatten(start_dim=2), None
+
 
 class VideoTranscriber:
-    """A class to handle video transcription using ffmpeg and OpenAI's Whisper."""
+    """A class to handle video transcription using PyAV and OpenAI's Whisper."""
+
+    # Upper bound on concurrent audio decodes in transcribe_directory
+    MAX_EXTRACT_WORKERS = 4
+
+    # Sample rate of the mono audio Whisper consumes
+    WHISPER_SAMPLE_RATE = 16000
+
+    # Same quality guards as model.transcribe, applied to batched decoding
+    COMPRESSION_RATIO_THRESHOLD = 2.4
+    LOGPROB_THRESHOLD = -1.0
+    NO_SPEECH_THRESHOLD = 0.6
+    FALLBACK_TEMPERATURES = (0.2, 0.4, 0.6, 0.8, 1.0)
 
-    def __init__(self, model_size: str = "medium", device: str = "cpu"):
+    def __init__(self, model_size: str = "medium", device: Optional[str] = None, batch_size: int = 1,
+                 vad: bool = False, backend: str = "whisper"):
         """
         Initialize the transcriber with the specified model size.
         
         Args:
             model_size: Size of the Whisper model to use ('tiny', 'base', 'small', 'medium', 'large')
-            device: Device to run the model on ('cpu' or 'cuda' for GPU)
+            device: Device to run the model on ('cpu', 'cuda' for GPU, or 'auto'/None to use CUDA when available)
+            batch_size: Number of 30-second windows decoded together (1 uses Whisper's sequential transcription)
+            vad: Whether to strip silence with Silero VAD before transcription
+            backend: Inference implementation ('whisper' for OpenAI's, or 'faster-whisper' for CTranslate2 with
+                int8 weights on CPU and float16 on GPU)
         """
-        print(f"Loading Whisper model '{model_size}'...")
-        self.model = whisper.load_model(model_size, device=device)
+        if device is None or device == "auto":
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.device = device
+        self.batch_size = batch_size
+        self.vad = vad
+        self._vad = None  # (model, get_speech_timestamps), loaded on first use
+        self.backend = backend
+
+        self.cpu_threads = int(os.environ.get("WHISPER_THREADS", os.cpu_count() or 1))
+        if device == "cpu":
+            # Load on a single thread so this process never starts torch's OpenMP pool
+            # here: the pool does not survive fork, and daemon workers that inherit it
+            # hang on their first parallel region
+            torch.set_num_threads(1)
+
+        print(f"Loading Whisper model '{model_size}' on {device}...")
+        if backend == "faster-whisper":
+            # Optional dependency, only needed for this backend
+            from faster_whisper import WhisperModel
+            # CTranslate2 has its own thread pool and ignores the torch settings
+            self.model = WhisperModel(model_size, device=device, cpu_threads=self.cpu_threads,
+                                      compute_type="int8" if device == "cpu" else "float16")
+            self._batched_pipeline = None  # BatchedInferencePipeline, created on first use
+        else:
+            self.model = whisper.load_model(model_size, device=device)
+            self._enable_sdpa()
+        if device == "cpu":
+            self._configure_cpu_threads()
         self.supported_video_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.webm', '.wmv', '.flv']
-        self.supported_audio_extensions = ['.mp3', '.wav']
+        self.supported_audio_extensions = ['.mp3', '.wav', '.flac', '.m4a']
+        self._extension_set = frozenset(self.supported_video_extensions + self.supported_audio_extensions)
         print(f"Model loaded and ready to transcribe!")
 
-    def extract_audio(self, video_path: str, output_path: Optional[str] = None) -> str:
+    def _enable_sdpa(self):
+        """Run Whisper's attention through PyTorch's fused scaled_dot_product_attention (flash/memory-efficient) kernels."""
+        attention = whisper.model.MultiHeadAttention
+        if hasattr(attention, "use_sdpa"):
+            # Built into openai-whisper since 20240927, but can be switched off
+            attention.use_sdpa = True
+        elif hasattr(F, "scaled_dot_product_attention"):
+            attention.qkv_attention = _sdpa_qkv_attention
+
+    def _configure_cpu_threads(self):
+        """Give all cores to intra-op parallelism (the encoder matmuls) and keep a single inter-op thread."""
+        torch.set_num_threads(self.cpu_threads)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Can only be set once per process, before any inter-op work (e.g. a second transcriber)
+            pass
+
+    def decode_audio(self, video_path: str) -> np.ndarray:
         """
-        Extract audio from a video file using ffmpeg.
+        Decode the audio track of a media file in-process with PyAV.
         
         Args:
-            video_path: Path to the video file
-            output_path: Path to save the extracted audio (optional)
+            video_path: Path to the video or audio file
             
         Returns:
-            The path to the extracted audio file
+            The audio as a 16 kHz mono float32 array, as consumed by Whisper
         """
-        if output_path is None:
-            # Create a temporary file with .wav extension
-            fd, output_path = tempfile.mkstemp(suffix='.wav')
-            os.close(fd)
-
-        command = [
-            'ffmpeg',
-            '-i', video_path,
-            '-q:a', '0',
-            '-map', 'a',
-            '-y',  # Overwrite output file if it exists
-            output_path
-        ]
+        resampler = av.AudioResampler(format='flt', layout='mono', rate=self.WHISPER_SAMPLE_RATE)
+        chunks = []
+
+        with av.open(video_path) as container:
+            stream = container.streams.audio[0]
+            stream.thread_type = "AUTO"
+            for frame in container.decode(stream):
+                for resampled in resampler.resample(frame):
+                    chunks.append(resampled.to_ndarray().reshape(-1))
+            # Flush the samples still buffered in the resampler
+            for resampled in resampler.resample(None):
+                chunks.append(resampled.to_ndarray().reshape(-1))
 
+        if not chunks:
+            return np.zeros(0, dtype=np.float32)
+        return np.concatenate(chunks).astype(np.float32, copy=False)
+
+    def _save_wav(self, audio: np.ndarray, output_path: str):
+        """Save decoded audio as a 16 kHz mono 16-bit PCM WAV file, the exact format Whisper consumes."""
+        pcm = (np.clip(audio, -1.0, 1.0) * 32767).astype('<i2')
+        created = not os.path.exists(output_path)
         try:
-            subprocess.run(command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            return output_path
-        except subprocess.CalledProcessError as e:
-            print(f"Error extracting audio: {e}")
-            if os.path.exists(output_path):
+            with wave.open(output_path, 'wb') as f:
+                f.setnchannels(1)
+                f.setsampwidth(2)
+                f.setframerate(self.WHISPER_SAMPLE_RATE)
+                f.writeframes(pcm.tobytes())
+        except OSError as e:
+            print(f"Error saving audio: {e}")
+            # Only remove a file this call created, never a pre-existing one
+            if created and os.path.exists(output_path):
                 os.remove(output_path)
             raise
 
-    def transcribe_audio(self, audio_path: str, output_dir: Optional[str] = None, language: Optional[str] = None) -> dict:
+    def transcribe_audio(self, audio_path: str, output_dir: Optional[str] = None,
+                         language: Optional[str] = None, output_name: Optional[str] = None) -> str:
         """
         Transcribe audio using Whisper.
         
         Args:
             audio_path: Path to the audio file
+            output_dir: Directory to save the transcription (optional)
             language: Language code for transcription (optional)
+            output_name: Base name of the transcription files (defaults to the audio file name)
             
         Returns:
-            The transcription result
+            Path to the transcription file
         """
-        audio_filename = os.path.basename(audio_path)
-        audio_name = os.path.splitext(audio_filename)[0]
+        if output_dir is None:
+            output_dir = os.path.dirname(os.path.abspath(audio_path))
+        if output_name is None:
+            output_name = os.path.splitext(os.path.basename(audio_path))[0]
+
+        os.makedirs(output_dir, exist_ok=True)
+
+        return self._transcribe(self.decode_audio(audio_path), output_dir, output_name, language)
+
+    def _transcribe(self, audio: np.ndarray, output_dir: str, output_name: str,
+                    language: Optional[str] = None) -> str:
+        """Run Whisper on a decoded array and save the .txt and .srt outputs."""
+        transcription_path = os.path.join(output_dir, f"{output_name}.txt")
+        srt_path = os.path.join(output_dir, f"{output_name}.srt")
 
-        transcribe_options = {}
-        if language:
-            transcribe_options["language"] = language
-            
         start_time = time.time()
-        result = self.model.transcribe(audio_path, **transcribe_options)
-        end_time = time.time()
-             
-        # Save transcription
-        transcription_path = os.path.join(output_dir, f"{audio_name}.txt")
-        with open(transcription_path, 'w', encoding='utf-8') as f:
-            f.write(result["text"])
-            
-        # Also save timestamps if available
-        if "segments" in result:
-            srt_path = os.path.join(output_dir, f"{audio_name}.srt")
+        if self.backend == "faster-whisper":
+            # Segments are decoded lazily, so write each one to the SRT file as soon as it is available
+            text_parts = []
             with open(srt_path, 'w', encoding='utf-8') as f:
-                for i, segment in enumerate(result["segments"], 1):
-                    start = self._format_timestamp(segment["start"])
-                    end = self._format_timestamp(segment["end"])
-                    f.write(f"{i}\n")
-                    f.write(f"{start} --> {end}\n")
-                    f.write(f"{segment['text'].strip()}\n\n")
+                for i, segment in enumerate(self._transcribe_faster_whisper(audio, language), 1):
+                    f.write(self._format_srt_block(i, segment))
+                    f.flush()
+                    text_parts.append(segment.text)
+            end_time = time.time()
+
+            with open(transcription_path, 'w', encoding='utf-8') as f:
+                f.write("".join(text_parts))
+        else:
+            result = self._transcribe_whisper(audio, language)
+            end_time = time.time()
+
+            # Save transcription
+            with open(transcription_path, 'w', encoding='utf-8') as f:
+                f.write(result["text"])
+
+            # Also save timestamps if available
+            if "segments" in result:
+                # Build the whole file first so it is written with a single call
+                blocks = [self._format_srt_block(i, segment) for i, segment in enumerate(result["segments"], 1)]
+                with open(srt_path, 'w', encoding='utf-8') as f:
+                    f.write("".join(blocks))
         
         print(f"Transcription completed in {end_time - start_time:.2f} seconds")
         print(f"Transcription saved to {transcription_path}")
         return transcription_path
 
+    def _transcribe_whisper(self, audio: np.ndarray, language: Optional[str] = None) -> dict:
+        """Transcribe with OpenAI's Whisper, applying the VAD and batching options."""
+        # Half precision is only supported on GPU; on CPU Whisper falls back to FP32
+        transcribe_options = {"fp16": self.device == "cuda"}
+        if language:
+            transcribe_options["language"] = language
+
+        if self.vad:
+            audio, regions = self._strip_silence(audio)
+
+        if self.batch_size > 1:
+            result = self._transcribe_batched(audio, **transcribe_options)
+        else:
+            result = self.model.transcribe(audio, **transcribe_options)
 
+        if self.vad:
+            self._restore_timestamps(result["segments"], regions)
+        return result
+
+    def _transcribe_faster_whisper(self, audio: np.ndarray, language: Optional[str] = None) -> Iterator:
+        """
+        Transcribe with the faster-whisper backend.
+        
+        Batching and VAD use faster-whisper's own BatchedInferencePipeline and vad_filter.
+        The batched pipeline always splits the audio at the speech regions found by its VAD.
+        
+        Args:
+            audio: 16 kHz mono float32 array
+            language: Language code for transcription (optional)
+            
+        Returns:
+            A generator of segments with start, end and text attributes, decoded as it is consumed
+        """
+        if self.batch_size > 1:
+            if self._batched_pipeline is None:
+                from faster_whisper import BatchedInferencePipeline
+                self._batched_pipeline = BatchedInferencePipeline(model=self.model)
+            segments, _ = self._batched_pipeline.transcribe(audio, language=language, batch_size=self.batch_size)
+        else:
+            segments, _ = self.model.transcribe(audio, language=language, vad_filter=self.vad)
+        return segments
+
+    def _strip_silence(self, audio: np.ndarray) -> Tuple[np.ndarray, List[Tuple[float, float]]]:
+        """
+        Keep only the voiced parts of the audio using Silero VAD.
+        
+        Args:
+            audio: 16 kHz mono float32 array
+            
+        Returns:
+            The concatenated speech and, for each voiced region, its start time in the
+            speech audio and in the original audio
+        """
+        if self._vad is None:
+            model, utils = torch.hub.load('snakers4/silero-vad', 'silero_vad')
+            self._vad = (model, utils[0])
+        model, get_speech_timestamps = self._vad
+
+        speech_timestamps = get_speech_timestamps(
+            torch.from_numpy(audio), model, sampling_rate=self.WHISPER_SAMPLE_RATE
+        )
+        if not speech_timestamps:
+            return np.zeros(0, dtype=np.float32), []
+
+        regions = []
+        speech_start = 0
+        for timestamp in speech_timestamps:
+            regions.append((speech_start / self.WHISPER_SAMPLE_RATE, timestamp["start"] / self.WHISPER_SAMPLE_RATE))
+            speech_start += timestamp["end"] - timestamp["start"]
+
+        speech = np.concatenate([audio[timestamp["start"]:timestamp["end"]] for timestamp in speech_timestamps])
+        return speech, regions
+
+    def _restore_timestamps(self, segments: List[dict], regions: List[Tuple[float, float]]):
+        """Map segment times from the silence-stripped audio back to the original audio."""
+        speech_starts = [speech_start for speech_start, _ in regions]
+
+        def restore(seconds: float, end: bool = False) -> float:
+            # An end time on a region boundary belongs to the region it closes
+            index = (bisect_left if end else bisect_right)(speech_starts, seconds) - 1
+            speech_start, original_start = regions[max(index, 0)]
+            return original_start + seconds - speech_start
+
+        for segment in segments:
+            segment["start"] = restore(segment["start"])
+            segment["end"] = restore(segment["end"], end=True)
+
+    def _transcribe_batched(self, audio: np.ndarray, fp16: bool = False,
+                            language: Optional[str] = None) -> dict:
+        """
+        Transcribe fixed 30-second windows in batches of batch_size.
+        
+        Unlike Whisper's sequential transcription, windows are not conditioned on the
+        previous text, which keeps the GPU busy with one encoder pass per batch.
+        
+        Args:
+            audio: 16 kHz mono float32 array
+            fp16: Whether to run the model in half precision
+            language: Language code for transcription (detected on the first window if omitted)
+            
+        Returns:
+            A result dict with the same "text" and "segments" keys as model.transcribe
+        """
+        n_mels = self.model.dims.n_mels
+        chunks = [audio[i:i + whisper.audio.N_SAMPLES] for i in range(0, len(audio), whisper.audio.N_SAMPLES)]
+        if not chunks:
+            return {"text": "", "segments": [], "language": language}
+
+        def log_mel(chunk):
+            return whisper.log_mel_spectrogram(whisper.pad_or_trim(chunk), n_mels).to(self.model.device)
+
+        if language is None:
+            _, probs = self.model.detect_language(log_mel(chunks[0]))
+            language = max(probs, key=probs.get)
+
+        options = whisper.DecodingOptions(language=language, fp16=fp16, without_timestamps=False)
+        tokenizer = whisper.tokenizer.get_tokenizer(
+            self.model.is_multilingual, num_languages=self.model.num_languages,
+            language=language, task=options.task
+        )
+        input_stride = whisper.audio.N_FRAMES // self.model.dims.n_audio_ctx
+        time_precision = input_stride * whisper.audio.HOP_LENGTH / whisper.audio.SAMPLE_RATE
+
+        segments = []
+        for batch_start in range(0, len(chunks), self.batch_size):
+            batch = chunks[batch_start:batch_start + self.batch_size]
+            mel = torch.stack([log_mel(chunk) for chunk in batch])
+            for index, decoded in enumerate(self._decode_with_fallback(mel, options), batch_start):
+                # Skip silent windows, as model.transcribe does, instead of keeping hallucinated text
+                if (decoded.no_speech_prob > self.NO_SPEECH_THRESHOLD
+                        and decoded.avg_logprob < self.LOGPROB_THRESHOLD):
+                    continue
+                # Shift the window-relative timestamps to the position of the window in the audio
+                offset = index * whisper.audio.CHUNK_LENGTH
+                duration = len(chunks[index]) / whisper.audio.SAMPLE_RATE
+                segments.extend(self._token_segments(decoded.tokens, tokenizer, time_precision, offset, duration))
+
+        return {"text": "".join(segment["text"] for segment in segments), "segments": segments, "language": language}
+
+    def _decode_with_fallback(self, mel: torch.Tensor, options) -> list:
+        """
+        Decode a batch of windows, re-decoding the failed ones at higher temperatures.
+        
+        Mirrors model.transcribe: a window is retried when its text is too repetitive
+        (compression ratio) or too unlikely (average log probability), unless it is silence.
+        """
+        results = whisper.decode(self.model, mel, options)
+
+        for temperature in self.FALLBACK_TEMPERATURES:
+            retry = [
+                index for index, decoded in enumerate(results)
+                if (decoded.compression_ratio > self.COMPRESSION_RATIO_THRESHOLD
+                    or decoded.avg_logprob < self.LOGPROB_THRESHOLD)
+                and decoded.no_speech_prob <= self.NO_SPEECH_THRESHOLD
+            ]
+            if not retry:
+                break
+            retried = whisper.decode(self.model, mel[retry], dataclasses.replace(options, temperature=temperature))
+            for index, decoded in zip(retry, retried):
+                results[index] = decoded
+
+        return results
+
+    def _token_segments(self, tokens: List[int], tokenizer, time_precision: float,
+                        offset: float, duration: float) -> List[dict]:
+        """Split decoded tokens of one window into segments at its timestamp tokens."""
+        segments = []
+        start = 0.0
+        text_tokens = []
+
+        for token in tokens:
+            if token < tokenizer.eot:
+                text_tokens.append(token)
+                continue
+            if token < tokenizer.timestamp_begin:
+                continue
+
+            time = min((token - tokenizer.timestamp_begin) * time_precision, duration)
+            if text_tokens:
+                segments.append({"start": offset + start, "end": offset + time,
+                                 "text": tokenizer.decode(text_tokens)})
+                text_tokens = []
+            start = time
+
+        # Text after the last timestamp runs until the end of the window
+        if text_tokens:
+            segments.append({"start": offset + start, "end": offset + duration,
+                             "text": tokenizer.decode(text_tokens)})
+        return segments
 
     def transcribe_video(self, video_path: str, output_dir: Optional[str] = None, 
                         language: Optional[str] = None, keep_audio: bool = False) -> str:
@@ -119,33 +422,27 @@ class VideoTranscriber:
             Path to the transcription file
         """
         video_path = os.path.abspath(video_path)
-        video_filename = os.path.basename(video_path)
-        video_name = os.path.splitext(video_filename)[0]
         
         if output_dir is None:
             output_dir = os.path.dirname(video_path)
         
         os.makedirs(output_dir, exist_ok=True)
         
-        # Extract audio
-        print(f"Extracting audio from {video_filename}...")
-        audio_path = os.path.join(output_dir, f"{video_name}.wav") if keep_audio else None
-        audio_path = self.extract_audio(video_path, audio_path)
-        
-        # Transcribe audio
-        print(f"Transcribing audio...")
-        transcription_path = self.transcribe_audio(audio_path, language)
-        
-        # Clean up temporary audio file if we're not keeping it
-        if not keep_audio and audio_path.startswith(tempfile.gettempdir()):
-            os.remove(audio_path)
-          
-        return transcription_path
+        video_name = os.path.splitext(os.path.basename(video_path))[0]
+        audio_path = os.path.join(output_dir, f"{video_name}.wav")
+        # An audio input can itself be the kept file; never write over the source
+        if not keep_audio or os.path.abspath(audio_path) == video_path:
+            audio_path = None
+        audio = self._prepare_audio(video_path, audio_path)
+        return self._transcribe_prepared(audio, output_dir, video_name, language)
         
     def transcribe_directory(self, directory: str, output_dir: Optional[str] = None, 
                            language: Optional[str] = None, keep_audio: bool = False) -> List[str]:
         """
-        Transcribe all video files in a directory.
+        Transcribe all video and audio files in a directory.
+
+        Audio decoding for the upcoming videos runs in parallel while the current
+        video is being transcribed, so decoding stays off the critical path.
         
         Args:
             directory: Path to the directory containing video files
@@ -159,49 +456,311 @@ class VideoTranscriber:
         directory = os.path.abspath(directory)
         if output_dir is None:
             output_dir = directory
+        output_dir = os.path.abspath(output_dir)
             
         os.makedirs(output_dir, exist_ok=True)
         
         transcription_paths = []
-        video_files = []
         
-        # Find all video files
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if any(file.lower().endswith(ext) for ext in self.supported_video_extensions):
-                    video_files.append(os.path.join(root, file))
+        # Find all video and audio files
+        media_files = list(self._iter_media_files(directory))
+        jobs = self._plan_outputs(media_files, output_dir, keep_audio)
         
-        if not video_files:
-            print(f"No video files found in {directory}")
+        if not jobs:
+            print(f"No video or audio files found in {directory}")
             return []
         
-        print(f"Found {len(video_files)} video files to transcribe")
+        print(f"Found {len(jobs)} files to transcribe")
         
-        # Transcribe each video
-        for video_path in tqdm(video_files, desc="Transcribing videos"):
-            try:
-                transcription_path = self.transcribe_video(
-                    video_path, output_dir, language, keep_audio
-                )
-                transcription_paths.append(transcription_path)
-            except Exception as e:
-                print(f"Error transcribing {video_path}: {e}")
+        # Each decode only keeps one or two cores busy, so run several at once.
+        # Threads are enough since PyAV releases the GIL while decoding; only
+        # as many videos as there are workers are decoded ahead to bound memory usage.
+        workers = min(self.MAX_EXTRACT_WORKERS, os.cpu_count() or 1, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            remaining = iter(jobs)
+            for video_path, output_name, audio_path in islice(remaining, workers):
+                pending.append((video_path, output_name, executor.submit(
+                    self._prepare_audio, video_path, audio_path
+                )))
+
+            # Transcribe each video
+            for _ in tqdm(range(len(jobs)), desc="Transcribing videos"):
+                video_path, output_name, future = pending.popleft()
+                for next_video_path, next_output_name, next_audio_path in islice(remaining, 1):
+                    pending.append((next_video_path, next_output_name, executor.submit(
+                        self._prepare_audio, next_video_path, next_audio_path
+                    )))
+                try:
+                    audio = future.result()
+                    transcription_path = self._transcribe_prepared(
+                        audio, output_dir, output_name, language
+                    )
+                    transcription_paths.append(transcription_path)
+                except Exception as e:
+                    print(f"Error transcribing {video_path}: {e}")
                 
         return transcription_paths
+
+    def _iter_media_files(self, root: str) -> Iterator[str]:
+        """Yield the supported video and audio files under root, using one scandir call per directory."""
+        stack = [root]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                # Skip unreadable directories, like os.walk does
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in self._extension_set:
+                        yield entry.path
+
+    def _plan_outputs(self, media_files: List[str], output_dir: str,
+                      keep_audio: bool) -> List[Tuple[str, str, Optional[str]]]:
+        """
+        Give each media file of a directory its own output names in output_dir.
+
+        Outputs are named after the file, or after the file name with its extension
+        when several files share a name (e.g. talk.mp4 and talk.flac). WAV files kept
+        by a previous run are not transcribed again, and no input is ever overwritten
+        by a kept WAV.
+
+        Args:
+            media_files: Paths of the discovered video and audio files
+            output_dir: Absolute path of the directory receiving the transcriptions
+            keep_audio: Whether to keep the extracted audio files
+
+        Returns:
+            (media path, output name, kept audio path or None) for each file to transcribe
+        """
+        inputs = {os.path.normcase(path) for path in media_files}
+        # Output names a previous run may have kept audio under: talk for talk.mp4, or talk.mp4 on a collision
+        output_names = set()
+        for path in media_files:
+            filename = os.path.basename(path).lower()
+            output_names.update((filename, os.path.splitext(filename)[0]))
+
+        sources = []
+        for path in media_files:
+            name, ext = os.path.splitext(os.path.basename(path))
+            if (ext.lower() == '.wav' and os.path.dirname(path) == output_dir
+                    and name.lower() in output_names and self._is_kept_audio(path)):
+                print(f"Skipping {path}: audio kept by a previous run")
+                continue
+            sources.append(path)
+
+        name_counts = {}
+        for path in sources:
+            name = os.path.splitext(os.path.basename(path))[0].lower()
+            name_counts[name] = name_counts.get(name, 0) + 1
+
+        jobs = []
+        taken = set()
+        for path in sources:
+            output_name = os.path.splitext(os.path.basename(path))[0]
+            if name_counts[output_name.lower()] > 1:
+                output_name = os.path.basename(path)
+            if output_name.lower() in taken:
+                # Same file name in different subdirectories of the same output directory
+                print(f"Skipping {path}: its transcription would overwrite the one of another file named {output_name}")
+                continue
+            taken.add(output_name.lower())
+
+            audio_path = os.path.join(output_dir, f"{output_name}.wav")
+            if not keep_audio or os.path.normcase(audio_path) in inputs:
+                audio_path = None
+            jobs.append((path, output_name, audio_path))
+        return jobs
+
+    def _is_kept_audio(self, path: str) -> bool:
+        """Whether a WAV file has the format _save_wav writes (16-bit mono at Whisper's sample rate)."""
+        try:
+            with wave.open(path, 'rb') as f:
+                return (f.getnchannels(), f.getsampwidth(), f.getframerate()) == (1, 2, self.WHISPER_SAMPLE_RATE)
+        except (wave.Error, EOFError, OSError):
+            return False
+
+    def transcribe_path(self, path: str, output_dir: Optional[str] = None,
+                        language: Optional[str] = None, keep_audio: bool = False) -> List[str]:
+        """
+        Transcribe a video file, an audio file or a directory.
+        
+        Args:
+            path: Path to a video file, audio file or directory
+            output_dir: Directory to save the transcriptions (optional)
+            language: Language code for transcription (optional)
+            keep_audio: Whether to keep the extracted audio files
+            
+        Returns:
+            List of paths to the transcription files
+        """
+        # Check if the path is a file or directory
+        path = os.path.abspath(path)
+        if os.path.isfile(path):
+            # Transcribe a single file
+            if any(path.lower().endswith(ext) for ext in self.supported_video_extensions):
+                return [self.transcribe_video(path, output_dir, language, keep_audio)]
+
+            if any(path.lower().endswith(ext) for ext in self.supported_audio_extensions):
+                return [self.transcribe_audio(path, output_dir, language)]
+
+            raise ValueError(f"The file {path} is not a supported video format.")
+
+        if os.path.isdir(path):
+            # Transcribe all videos in the directory
+            return self.transcribe_directory(path, output_dir, language, keep_audio)
+
+        raise ValueError(f"The path {path} does not exist.")
+
+    def _prepare_audio(self, video_path: str, audio_path: Optional[str] = None) -> np.ndarray:
+        """Decode the audio of a video into an in-memory array, also saving it to audio_path if given."""
+        print(f"Decoding audio from {os.path.basename(video_path)}...")
+        audio = self.decode_audio(video_path)
+        if audio_path is not None:
+            self._save_wav(audio, audio_path)
+        return audio
+
+    def _transcribe_prepared(self, audio: np.ndarray, output_dir: str, output_name: str,
+                             language: Optional[str]) -> str:
+        """Transcribe audio returned by _prepare_audio into output_name.txt/.srt."""
+        print(f"Transcribing audio...")
+        return self._transcribe(audio, output_dir, output_name, language)
     
+    def _format_srt_block(self, index: int, segment) -> str:
+        """Format one SRT entry from a segment dict (whisper) or segment object (faster-whisper)."""
+        if isinstance(segment, dict):
+            start, end, text = segment["start"], segment["end"], segment["text"]
+        else:
+            start, end, text = segment.start, segment.end, segment.text
+        return f"{index}\n{self._format_timestamp(start)} --> {self._format_timestamp(end)}\n{text.strip()}\n\n"
+
     def _format_timestamp(self, seconds: float) -> str:
         """Convert seconds to SRT timestamp format (HH:MM:SS,mmm)"""
-        hours = int(seconds // 3600)
-        seconds %= 3600
-        minutes = int(seconds // 60)
-        seconds %= 60
-        milliseconds = int((seconds - int(seconds)) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{int(seconds):02d},{milliseconds:03d}"
+        milliseconds = int(seconds * 1000)
+        seconds, milliseconds = divmod(milliseconds, 1000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+
+
+def _daemon_authkey() -> bytes:
+    """Shared secret for the transcription daemon, from the environment or a per-user key file."""
+    authkey = os.environ.get("VIDEO_TRANSCRIBER_AUTHKEY")
+    if authkey:
+        return authkey.encode()
+
+    key_path = os.path.join(os.path.expanduser("~"), ".video-transcriber-daemon.key")
+    if not os.path.exists(key_path):
+        # Write the key to a private temporary file and publish it with a hard link, so a
+        # concurrent daemon/client never reads a partially written key
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(key_path))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(secrets.token_hex(32).encode())
+            os.link(tmp_path, key_path)
+        except FileExistsError:
+            # Another process created the key first; use theirs
+            pass
+        finally:
+            os.remove(tmp_path)
+    with open(key_path, 'rb') as f:
+        return f.read().strip()
+
+
+def _accept_requests(listener: Listener, transcriber: VideoTranscriber):
+    """Transcribe the requests of the clients accepted on listener, one at a time."""
+    while True:
+        try:
+            conn = listener.accept()
+        except AuthenticationError as e:
+            print(f"Rejected connection: {e}")
+            continue
+
+        with conn:
+            try:
+                path, output_dir, language, keep_audio = conn.recv()
+                conn.send(("ok", transcriber.transcribe_path(path, output_dir, language, keep_audio)))
+            except Exception as e:
+                print(f"Error transcribing request: {e}")
+                conn.send(("error", str(e)))
+
+
+def _worker(listener: Listener, transcriber: VideoTranscriber, threads: int):
+    """Entry point of a forked daemon worker, splitting the CPU threads between the workers."""
+    torch.set_num_threads(threads)
+    _accept_requests(listener, transcriber)
+
+
+def serve(transcriber: VideoTranscriber, port: int = DAEMON_PORT, workers: int = 1):
+    """
+    Keep the loaded model in memory and transcribe paths sent by clients.
+    
+    Args:
+        transcriber: The transcriber whose model serves every request
+        port: Local port to listen on
+        workers: Number of forked worker processes handling requests concurrently
+    """
+    if workers > 1 and (transcriber.device != "cpu" or transcriber.backend != "whisper" or not hasattr(os, "fork")):
+        # CUDA cannot be used from forked children, and spawning would load one model per worker
+        print("Warning: multiple daemon workers need a CPU whisper model on a platform with fork; using 1 worker")
+        workers = 1
+
+    with Listener(('localhost', port), authkey=_daemon_authkey()) as listener:
+        print(f"Transcription daemon listening on localhost:{port}")
+        if workers == 1:
+            _accept_requests(listener, transcriber)
+            return
+
+        # Forked workers share the parent's weights copy-on-write; inference never
+        # writes to them, so the model stays in memory once. The parent must not run any
+        # torch computation from here on, or the children inherit a broken OpenMP pool
+        context = multiprocessing.get_context("fork")
+        threads = max(1, transcriber.cpu_threads // workers)
+        processes = [
+            context.Process(target=_worker, args=(listener, transcriber, threads))
+            for _ in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+
+def send_to_daemon(path: str, output_dir: Optional[str] = None, language: Optional[str] = None,
+                   keep_audio: bool = False, port: int = DAEMON_PORT) -> List[str]:
+    """
+    Ask a running transcription daemon to transcribe a file or directory.
+    
+    Args:
+        path: Path to a video file, audio file or directory
+        output_dir: Directory to save the transcriptions (optional)
+        language: Language code for transcription (optional)
+        keep_audio: Whether to keep the extracted audio files
+        port: Local port the daemon listens on
+        
+    Returns:
+        List of paths to the transcription files
+    """
+    # The daemon may run from another working directory
+    path = os.path.abspath(path)
+    if output_dir is not None:
+        output_dir = os.path.abspath(output_dir)
+
+    with Client(('localhost', port), authkey=_daemon_authkey()) as conn:
+        conn.send((path, output_dir, language, keep_audio))
+        status, payload = conn.recv()
+
+    if status != "ok":
+        raise ValueError(payload)
+    return payload
 
 
 def main():
     parser = argparse.ArgumentParser(description='Transcribe video files using Whisper')
-    parser.add_argument('path', type=str, help='Path to video file or directory')
+    parser.add_argument('path', type=str, nargs='?', help='Path to video file or directory')
     parser.add_argument('--output', '-o', type=str, help='Output directory for transcriptions')
     parser.add_argument('--model', '-m', type=str, default='medium',
                         choices=['tiny', 'base', 'small', 'medium', 'large'],
@@ -209,45 +768,67 @@ def main():
     parser.add_argument('--language', '-l', type=str, help='Language code (optional)')
     parser.add_argument('--keep-audio', '-k', action='store_true', 
                         help='Keep extracted audio files')
-    parser.add_argument('--device', '-d', type=str, default='cpu',
-                        choices=['cpu', 'cuda'], help='Device to run Whisper on')
+    parser.add_argument('--device', '-d', type=str, default='auto',
+                        choices=['auto', 'cpu', 'cuda'],
+                        help='Device to run Whisper on (auto uses CUDA when available)')
+    parser.add_argument('--backend', type=str, default='whisper',
+                        choices=['whisper', 'faster-whisper'],
+                        help='Inference backend (faster-whisper runs int8 on CPU and float16 on GPU)')
+    parser.add_argument('--batch-size', '-b', type=int, default=1,
+                        help='Decode this many 30-second windows at once (faster on GPU, 1 disables batching)')
+    parser.add_argument('--vad', action='store_true',
+                        help='Strip silence with Silero VAD before transcribing')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Keep the model loaded and serve transcription requests from --client runs')
+    parser.add_argument('--client', action='store_true',
+                        help='Send the path to a running --daemon instead of loading the model')
+    parser.add_argument('--daemon-workers', type=int, default=1,
+                        help='Number of processes serving --daemon requests concurrently, sharing one CPU model')
+    parser.add_argument('--port', type=int, default=DAEMON_PORT,
+                        help='Local port used by --daemon and --client')
     
     args = parser.parse_args()
+
+    if args.daemon and args.client:
+        parser.error("--daemon and --client cannot be used together")
+    if args.path is None and not args.daemon:
+        parser.error("the following arguments are required: path")
+
+    if args.client:
+        try:
+            for transcription_path in send_to_daemon(
+                args.path, args.output, args.language, args.keep_audio, args.port
+            ):
+                print(f"Transcription saved to {transcription_path}")
+        except ConnectionRefusedError:
+            print(f"Error: no transcription daemon is listening on port {args.port}.")
+            return 1
+        except AuthenticationError:
+            print(f"Error: the transcription daemon on port {args.port} rejected the authentication key.")
+            return 1
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 1
+        return 0
     
+    # Initialize the transcriber
     try:
-        # Check if ffmpeg is installed
-        subprocess.run(['ffmpeg', '-version'], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("Error: ffmpeg is not installed or not in PATH. Please install ffmpeg.")
+        transcriber = VideoTranscriber(
+            model_size=args.model, device=args.device, batch_size=args.batch_size, vad=args.vad,
+            backend=args.backend
+        )
+    except ImportError as e:
+        print(f"Error: {e}. Install faster-whisper to use the faster-whisper backend.")
         return 1
+
+    if args.daemon:
+        serve(transcriber, args.port, args.daemon_workers)
+        return 0
     
-    # Initialize the transcriber
-    transcriber = VideoTranscriber(model_size=args.model, device=args.device)
-    
-    # Check if the path is a file or directory
-    path = os.path.abspath(args.path)
-    if os.path.isfile(path):
-        # Transcribe a single file
-        if any(path.lower().endswith(ext) for ext in transcriber.supported_video_extensions):
-            transcriber.transcribe_video(
-                path, args.output, args.language, args.keep_audio
-            )
-            return 0
-        
-        if any(path.lower().endswith(ext) for ext in transcriber.supported_audio_extensions):
-            transcriber.transcribe_audio(path, args.output, args.language)
-            return 0
-        
-        print(f"Error: The file {path} is not a supported video format.")
-        return 1
-        
-    elif os.path.isdir(path):
-        # Transcribe all videos in the directory
-        transcriber.transcribe_directory(
-            path, args.output, args.language, args.keep_audio
-        )
-    else:
-        print(f"Error: The path {path} does not exist.")
+    try:
+        transcriber.transcribe_path(args.path, args.output, args.language, args.keep_audio)
+    except ValueError as e:
+        print(f"Error: {e}")
         return 1
     
     return 0